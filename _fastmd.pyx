@@ -0,0 +1,32 @@
+# cython: boundscheck=False, wraparound=False
+"""
+C-compiled row assembly for excel_to_md's large-table fast path.
+
+Built by setup.py when Cython is available; excel_to_md falls back to
+the pure-Python join when this module cannot be imported.
+"""
+
+
+cpdef list rows_to_md(object[:, :] cells):
+    """
+    Assemble '| a | b |' row strings from a 2D object array of cell strings
+
+    Args:
+        cells: Object array of shape (rows, columns), every cell a str
+
+    Returns:
+        list: One Markdown row string per table row
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n = cells.shape[0]
+    cdef Py_ssize_t m = cells.shape[1]
+    cdef list rows = [None] * n
+    cdef list parts
+
+    for i in range(n):
+        parts = [None] * m
+        for j in range(m):
+            parts[j] = cells[i, j]
+        rows[i] = "| " + " | ".join(parts) + " |"
+
+    return rows
@@ -10,10 +10,14 @@ import sys
 import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-from excel_to_md import read_file, dataframe_to_markdown
+from excel_to_md import read_file, dataframe_to_markdown, EXCEL_ENGINE
 import pandas as pd
 from pathlib import Path
 
+# Maximum number of rows rendered in the preview pane -- Convert & Save
+# always converts the full sheet
+PREVIEW_ROWS = 200
+
 
 class ExcelToMarkdownApp:
     def __init__(self, root):
@@ -34,6 +38,8 @@ class ExcelToMarkdownApp:
         self.df = None
         self.sheets = []
         self.current_sheet = None
+        self._all_dfs = {}
+        self._preview_cache = {}
         
         # Create the UI
         self.create_widgets()
@@ -157,23 +163,28 @@ class ExcelToMarkdownApp:
     def load_file(self):
         try:
             file_ext = os.path.splitext(self.input_file)[1].lower()
+            self._preview_cache.clear()
             
-            # For Excel files, get sheet names
+            # For Excel files, parse the whole workbook in one pass instead
+            # of reading it once for the sheet names and again per sheet
             if file_ext in ['.xlsx', '.xls']:
-                excel_file = pd.ExcelFile(self.input_file)
-                self.sheets = excel_file.sheet_names
-                
+                # Keep every parsed sheet around so switching sheets later
+                # doesn't re-read the workbook
+                self._all_dfs = pd.read_excel(self.input_file, sheet_name=None, engine=EXCEL_ENGINE)
+                self.sheets = list(self._all_dfs)
+
                 # Update the sheet combobox
                 self.sheet_combobox['values'] = ['All Sheets'] + self.sheets
                 self.sheet_combobox.current(0)  # Set to "All Sheets" by default
                 self.current_sheet = None
-                
+
                 # Load the first sheet for preview
-                self.df = pd.read_excel(self.input_file, sheet_name=self.sheets[0])
+                self.df = self._all_dfs[self.sheets[0]]
             else:
                 # For CSV files
                 self.df = read_file(self.input_file)
                 self.sheets = []
+                self._all_dfs = {}
                 self.sheet_combobox['values'] = ['']
                 self.sheet_combobox.current(0)
                 self.current_sheet = None
@@ -186,21 +197,33 @@ class ExcelToMarkdownApp:
     def on_sheet_selected(self, event):
         selected = self.sheet_combobox.get()
         
+        # Sheets were all parsed in load_file, so switching is a plain
+        # dictionary lookup instead of re-reading the workbook
         if selected == 'All Sheets':
             self.current_sheet = None
             if self.sheets:
-                self.df = pd.read_excel(self.input_file, sheet_name=self.sheets[0])
+                self.df = self._all_dfs[self.sheets[0]]
         else:
             self.current_sheet = selected
-            self.df = pd.read_excel(self.input_file, sheet_name=selected)
+            self.df = self._all_dfs[selected]
         
         self.update_preview()
     
     def update_preview(self):
         if self.df is not None:
             include_headers = self.include_headers_var.get()
-            markdown = dataframe_to_markdown(self.df, headers=include_headers)
-            
+
+            # Only render the first PREVIEW_ROWS rows, and cache the result
+            # so toggling options or flipping between sheets doesn't rebuild
+            # the same table
+            key = (id(self.df), include_headers)
+            markdown = self._preview_cache.get(key)
+            if markdown is None:
+                markdown = dataframe_to_markdown(self.df.head(PREVIEW_ROWS), headers=include_headers)
+                if len(self.df) > PREVIEW_ROWS:
+                    markdown += f"\n\n... ({len(self.df) - PREVIEW_ROWS} more rows not shown in preview)"
+                self._preview_cache[key] = markdown
+
             # Update preview
             self.preview_text.delete(1.0, tk.END)
             self.preview_text.insert(tk.END, markdown)
@@ -233,9 +256,9 @@ class ExcelToMarkdownApp:
             
             # Process all sheets or just the selected one
             if file_ext in ['.xlsx', '.xls'] and self.current_sheet is None:
-                # Convert all sheets
-                for sheet in self.sheets:
-                    df = pd.read_excel(self.input_file, sheet_name=sheet)
+                # Convert all sheets, reusing the DataFrames parsed at load time
+                dfs = self._all_dfs or pd.read_excel(self.input_file, sheet_name=None, engine=EXCEL_ENGINE)
+                for sheet, df in dfs.items():
                     markdown = f"## Sheet: {sheet}\n\n" + dataframe_to_markdown(df, headers=include_headers)
                     all_markdown.append(markdown)
             else:
@@ -3,6 +3,17 @@ from setuptools import setup, find_packages
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional C extension for the large-table row formatter; excel_to_md
+# falls back to the pure-Python path when it isn't built
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        "_fastmd.pyx",
+        compiler_directives={"boundscheck": False, "wraparound": False},
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="excel_to_markdown",
     version="0.1.0",
@@ -13,6 +24,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/excel_to_markdown",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -20,12 +32,16 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[
-        "pandas>=2.0.0",
+        "pandas>=2.2.0",
         "openpyxl>=3.0.0",
         "xlrd>=2.0.0",
         "click>=8.0.0",
         "rich>=12.0.0",
         "tabulate>=0.8.0",
+        "python-calamine>=0.2.0",
+        "pyarrow>=14.0.0",
+        "charset-normalizer>=3.0.0",
+        "chardet>=5.0.0",
     ],
     entry_points={
         "console_scripts": [